@@ -0,0 +1,74 @@
+# Compare Flask's stdlib JSON provider with the orjson provider on order-shaped payloads.
+# Runs without a database: python json_benchmark.py [orders_per_payload] [repeats]
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from json_provider import OrjsonProvider
+from datetime import datetime, timedelta
+from decimal import Decimal
+import random
+import sys
+import timeit
+
+
+def build_orders(count):
+    # Same shape as GET /orders and the /place-order response: Decimal totals, datetimes and nested details
+    orders = []
+    start = datetime(2024, 1, 1, 9, 30)
+    for order_id in range(1, count + 1):
+        details = []
+        for line in range(random.randint(1, 8)):
+            product_id = random.randint(1, 5000)
+            details.append({
+                "order_id": order_id,
+                "product_id": product_id,
+                "product_name": f"Product {product_id}",
+                "quantity": random.randint(1, 20),
+                "price_per_unit": Decimal(random.randint(100, 99999)) / 100
+            })
+        order_date_time = start + timedelta(minutes=order_id)
+        orders.append({
+            "id": order_id,
+            "customer_id": random.randint(1, 10000),
+            "order_date_time": order_date_time,
+            "expected_delivery_date": (order_date_time + timedelta(days=5)).date(),
+            "total_amount": sum(detail["price_per_unit"] * detail["quantity"] for detail in details),
+            "order_details": details
+        })
+    return orders
+
+
+def bench(provider, payload, encoded, repeats):
+    dumps = min(timeit.repeat(lambda: provider.dumps(payload), number=1, repeat=repeats))
+    loads = min(timeit.repeat(lambda: provider.loads(encoded), number=1, repeat=repeats))
+    with provider._app.app_context():
+        response = min(timeit.repeat(lambda: provider.response(payload).get_data(), number=1, repeat=repeats))
+    return dumps, loads, response
+
+
+def main():
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    if not OrjsonProvider.available:
+        sys.exit("orjson is not installed; pip install orjson")
+
+    random.seed(42)
+    payload = build_orders(order_count)
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    fast_provider = OrjsonProvider(app)
+
+    # Both providers must agree on the decoded result before timing means anything
+    encoded = default_provider.dumps(payload)
+    assert fast_provider.loads(fast_provider.dumps(payload)) == default_provider.loads(encoded)
+
+    print(f"{order_count} orders, {len(encoded) / 1024:.0f} KiB of JSON, best of {repeats}")
+    print(f"{'provider':<10}{'dumps ms':>12}{'loads ms':>12}{'response ms':>14}")
+    results = {}
+    for name, provider in (("stdlib", default_provider), ("orjson", fast_provider)):
+        results[name] = bench(provider, payload, encoded, repeats)
+        print(f"{name:<10}" + "".join(f"{seconds * 1000:>{width}.2f}" for seconds, width in zip(results[name], (12, 12, 14))))
+    print(f"{'speedup':<10}" + "".join(f"{slow / fast:>{width}.1f}x" for slow, fast, width in zip(results["stdlib"], results["orjson"], (11, 11, 13))))
+
+
+if __name__ == '__main__':
+    main()
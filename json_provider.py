@@ -0,0 +1,56 @@
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+from datetime import date, datetime
+from decimal import Decimal
+
+# orjson is optional; without it the app keeps Flask's stdlib provider
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_extra_types(obj):
+    # Same representations as Flask's stdlib provider: RFC 822 dates and Decimal as a string
+    if isinstance(obj, (datetime, date)):
+        return http_date(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    return DefaultJSONProvider.default(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    # Drop-in replacement for Flask's provider backed by orjson. Output differs only in
+    # whitespace and in sending non-ASCII characters as UTF-8 instead of \u escapes.
+    available = orjson is not None
+
+    def options(self):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs):
+        # Formatting arguments (indent, separators, ...) are only honoured by the stdlib encoder
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=encode_extra_types, option=self.options()).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(obj)
+        body = orjson.dumps(obj, default=encode_extra_types, option=self.options() | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def configure_json_provider(app):
+    # JSON_PROVIDER: 'orjson' uses the fast provider when orjson is installed, 'default' keeps Flask's
+    if app.config.get('JSON_PROVIDER', 'orjson') == 'orjson' and OrjsonProvider.available:
+        app.json = OrjsonProvider(app)
+    return app.json
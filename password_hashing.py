@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+import multiprocessing
+import threading
+import bcrypt
+
+# bcrypt hashing and verification on a small pool of worker processes, so a burst of logins
+# cannot tie up the CPU of the web worker. At most max_pending calls are running or waiting
+# at any time; callers beyond that get PasswordHashingBusy immediately instead of queueing.
+
+
+class PasswordHashingBusy(Exception):
+    pass
+
+
+def hash_password(password):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+
+def check_password(password, hashed_password):
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode('utf-8')
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password)
+
+
+class PasswordHashingPool:
+    def __init__(self, workers, queue_depth, timeout):
+        self.workers = workers
+        self.max_pending = workers + queue_depth
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(self.max_pending)
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def get_executor(self):
+        # Started on first use. Spawned workers import this module, and also re-import app.py (as __mp_main__)
+        # when the app is run as a script; app.py skips its start-up block in them
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self.executor
+
+    def run(self, function, *args):
+        if not self.slots.acquire(blocking=False):
+            raise PasswordHashingBusy("Password hashing queue is full")
+        try:
+            future = self.get_executor().submit(function, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        # The slot is held until the worker finishes, even if this caller stops waiting
+        future.add_done_callback(lambda _: self.slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            raise PasswordHashingBusy("Password hashing timed out")
+
+    def hash(self, password):
+        return self.run(hash_password, password)
+
+    def check(self, password, hashed_password):
+        return self.run(check_password, password, hashed_password)
@@ -0,0 +1,157 @@
+from marshmallow import EXCLUDE, RAISE, ValidationError, fields, missing
+from collections.abc import Mapping
+
+# Generates a plain Python load function per marshmallow schema, once, at import time.
+# Each field gets an inline fast path for the JSON type it normally receives (int for Integer,
+# str for String, dict for Nested, ...). Any other value - None, a numeric string, a wrong type -
+# is handed to the field's own deserialize(), so error messages and coercions are marshmallow's.
+# Schemas using features the generator does not cover load through schema.load unchanged.
+
+FAST_PATH_TYPES = {
+    fields.Integer: "type(value) is int",
+    # Finite floats and ints that convert without overflow; NaN and infinities take the slow path
+    fields.Float: "(type(value) is float and value - value == 0.0) or (type(value) is int and -1e308 < value < 1e308)",
+    fields.String: "type(value) is str",
+    fields.Inferred: "value is not None",
+}
+
+
+def is_supported(schema):
+    if schema.many or schema.partial or schema.unknown not in (RAISE, EXCLUDE):
+        return False
+    if any(schema._hooks.values()):
+        return False
+    for field in schema.load_fields.values():
+        if field.data_key is not None or field.attribute is not None or field.load_default is not missing:
+            return False
+        if isinstance(field, fields.List):
+            field = field.inner
+            if field.validators or field.load_default is not missing:
+                return False
+        if isinstance(field, fields.Nested):
+            if field.many or field.unknown is not None or field.validators or not is_supported(field.schema):
+                return False
+        elif type(field) not in FAST_PATH_TYPES:
+            return False
+        if type(field) is fields.Integer and field.strict:
+            return False
+    return True
+
+
+class LoaderGenerator:
+    def __init__(self):
+        self.namespace = {"Mapping": Mapping, "ValidationError": ValidationError, "missing": missing}
+        self.functions = []
+        self.names = {}
+
+    def constant(self, prefix, value):
+        name = f"{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def value_lines(self, field, field_ref, target, error_target, indent):
+        # Lines that turn `value` into `target`, or store the field's messages in `error_target`
+        pad = " " * indent
+        lines = []
+        if isinstance(field, fields.Nested):
+            fast_check = "type(value) is dict"
+            fast_lines = [f"{pad}    try:",
+                          f"{pad}        {target} = {self.loader_for(field.schema)}(value)",
+                          f"{pad}    except ValidationError as error:",
+                          f"{pad}        {error_target} = error.messages"]
+        else:
+            fast_check = FAST_PATH_TYPES[type(field)]
+            conversion = "float(value)" if type(field) is fields.Float else "value"
+            fast_lines = [f"{pad}    {target} = {conversion}"]
+            if field.validators:
+                fast_lines = [f"{pad}    try:",
+                              f"{pad}        {field_ref}._validate({conversion})",
+                              f"{pad}        {target} = {conversion}",
+                              f"{pad}    except ValidationError as error:",
+                              f"{pad}        {error_target} = error.messages"]
+        lines.append(f"{pad}if {fast_check}:")
+        lines.extend(fast_lines)
+        lines.append(f"{pad}else:")
+        lines.append(f"{pad}    try:")
+        lines.append(f"{pad}        {target} = {field_ref}.deserialize(value)")
+        lines.append(f"{pad}    except ValidationError as error:")
+        lines.append(f"{pad}        {error_target} = error.messages")
+        return lines
+
+    def loader_for(self, schema):
+        key = id(schema)
+        if key in self.names:
+            return self.names[key]
+        name = f"load_{type(schema).__name__}_{len(self.names)}"
+        self.names[key] = name
+
+        type_error = self.constant("TYPE_ERROR", schema.error_messages["type"])
+        lines = [f"def {name}(data):",
+                 f"    if not isinstance(data, Mapping):",
+                 f"        raise ValidationError({{'_schema': [{type_error}]}}, data=data, valid_data={{}})",
+                 f"    result = {{}}",
+                 f"    errors = {{}}"]
+        for field_name, field in schema.load_fields.items():
+            field_ref = self.constant("field", field)
+            key_literal = repr(field_name)
+            lines.append(f"    value = data.get({key_literal}, missing)")
+            lines.append(f"    if value is missing:")
+            if field.required:
+                lines.append(f"        errors[{key_literal}] = {field_ref}.make_error('required').messages")
+            else:
+                lines.append(f"        pass")
+            if isinstance(field, fields.List):
+                inner_ref = self.constant("field", field.inner)
+                lines.append(f"    elif type(value) is list:")
+                lines.append(f"        items = []")
+                lines.append(f"        item_errors = {{}}")
+                lines.append(f"        for index, item in enumerate(value):")
+                lines.append(f"            value = item")
+                lines.extend(self.value_lines(field.inner, inner_ref, "item_value", "item_errors[index]", 12))
+                lines.append(f"            if index not in item_errors:")
+                lines.append(f"                items.append(item_value)")
+                lines.append(f"        if item_errors:")
+                lines.append(f"            errors[{key_literal}] = item_errors")
+                if field.validators:
+                    lines.append(f"        else:")
+                    lines.append(f"            try:")
+                    lines.append(f"                {field_ref}._validate(items)")
+                    lines.append(f"                result[{key_literal}] = items")
+                    lines.append(f"            except ValidationError as error:")
+                    lines.append(f"                errors[{key_literal}] = error.messages")
+                else:
+                    lines.append(f"        else:")
+                    lines.append(f"            result[{key_literal}] = items")
+                lines.append(f"    else:")
+                lines.append(f"        try:")
+                lines.append(f"            result[{key_literal}] = {field_ref}.deserialize(value)")
+                lines.append(f"        except ValidationError as error:")
+                lines.append(f"            errors[{key_literal}] = error.messages")
+            else:
+                lines.append(f"    else:")
+                lines.extend(self.value_lines(field, field_ref, f"result[{key_literal}]", f"errors[{key_literal}]", 8))
+
+        if schema.unknown == RAISE:
+            known = self.constant("KNOWN", frozenset(schema.load_fields))
+            unknown_message = self.constant("UNKNOWN", schema.error_messages["unknown"])
+            lines.append(f"    if not data.keys() <= {known}:")
+            lines.append(f"        for key in set(data) - {known}:")
+            lines.append(f"            errors[key] = [{unknown_message}]")
+        lines.append(f"    if errors:")
+        lines.append(f"        raise ValidationError(errors, data=data, valid_data=result)")
+        lines.append(f"    return result")
+        self.functions.append("\n".join(lines))
+        return name
+
+
+def compile_loader(schema):
+    # Returns a function with the same contract as schema.load(data) for single objects
+    if not is_supported(schema):
+        return schema.load
+    generator = LoaderGenerator()
+    name = generator.loader_for(schema)
+    source = "\n\n".join(generator.functions)
+    exec(compile(source, f"<compiled {type(schema).__name__}>", "exec"), generator.namespace)
+    loader = generator.namespace[name]
+    loader.source = source
+    return loader
@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+# Import the app against a throwaway SQLite file instead of the configured MySQL database
+test_dir = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(test_dir, 'test.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+
+# Keep the durable order queue out of the working tree as well
+app.config['ORDER_QUEUE_PATH'] = os.path.join(test_dir, 'order_queue.sqlite3')
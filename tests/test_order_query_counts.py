@@ -0,0 +1,62 @@
+from sqlalchemy import event
+from app import app, db, utc_now, Customer, Order, OrderDetail, Product
+from datetime import timedelta
+from decimal import Decimal
+import pytest
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def seed_orders(count):
+    # Fresh tables with one customer and `count` two-line orders
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        customer = Customer(name='Jane Doe', email='jane@example.com', phone='555-0100')
+        products = [Product(name='Widget', price=2.5), Product(name='Gadget', price=10)]
+        db.session.add(customer)
+        db.session.add_all(products)
+        db.session.flush()
+        for number in range(count):
+            order = Order(customer_id=customer.id, total_amount=Decimal('12.50'),
+                          order_date_time=utc_now() - timedelta(minutes=number))
+            order.order_details = [
+                OrderDetail(product_id=product.id, product_name=product.name, quantity=1, price_per_unit=product.price)
+                for product in products
+            ]
+            db.session.add(order)
+        db.session.commit()
+        return customer.id
+
+
+def count_queries(client, url):
+    # The first request warms per-worker caches so both sizes are measured the same way
+    assert client.get(url).status_code == 200
+    statements = []
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    assert response.status_code == 200
+    return len(statements)
+
+
+@pytest.mark.parametrize('url', [
+    '/orders',
+    '/orders?limit=1000',
+    '/orders/history-for-customer/{customer_id}',
+])
+def test_order_reads_use_a_fixed_number_of_queries(client, url):
+    counts = []
+    for order_count in (5, 50):
+        customer_id = seed_orders(order_count)
+        counts.append(count_queries(client, url.format(customer_id=customer_id)))
+    assert counts[0] == counts[1]
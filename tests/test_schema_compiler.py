@@ -0,0 +1,22 @@
+from validation_benchmark import LOADERS, ODD_VALUES, VALID_PAYLOADS, order_variants, outcome, variants
+import pytest
+
+
+def parity_payloads(name):
+    payloads = list(variants(VALID_PAYLOADS[name])) + ODD_VALUES
+    if name == "order":
+        payloads += list(order_variants())
+    return payloads
+
+
+@pytest.mark.parametrize('name', sorted(LOADERS))
+def test_hot_schemas_are_compiled(name):
+    _, compiled = LOADERS[name]
+    assert hasattr(compiled, 'source')
+
+
+@pytest.mark.parametrize('name', sorted(LOADERS))
+def test_compiled_loader_matches_marshmallow(name):
+    schema, compiled = LOADERS[name]
+    for payload in parity_payloads(name):
+        assert outcome(compiled, payload) == outcome(schema.load, payload), payload
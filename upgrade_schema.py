@@ -0,0 +1,72 @@
+# Bring a database created by an earlier version of app.py up to the current models.
+# db.create_all() (run when the app is imported) creates missing tables but never alters existing ones,
+# so columns and indexes added to existing tables are applied here, and the low-stock queue is seeded with
+# the products that were already at or below their reorder point. Safe to run more than once:
+#   python upgrade_schema.py
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.schema import CreateColumn
+from app import app, db, Catalog, LowStockQueue, queue_low_stock
+
+# (model, column name, default for the rows that already exist)
+ADDED_COLUMNS = [
+    (Catalog, 'stock_shard_count', '0'),
+    (Catalog, 'reorder_point', '10'),
+    (Catalog, 'reorder_quantity', '20'),
+]
+
+
+def add_missing_columns(connection, inspector):
+    added = []
+    for model, column_name, default in ADDED_COLUMNS:
+        table = model.__table__
+        if column_name in {column['name'] for column in inspector.get_columns(table.name)}:
+            continue
+        column_spec = CreateColumn(table.c[column_name]).compile(dialect=connection.dialect)
+        table_name = connection.dialect.identifier_preparer.quote(table.name)
+        connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_spec} DEFAULT {default}"))
+        added.append(f"{table.name}.{column_name}")
+    return added
+
+
+def add_missing_indexes(connection, inspector):
+    # Every index declared on the models, including the ones added to tables that predate them
+    added = []
+    for table in db.metadata.sorted_tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name not in existing:
+                index.create(bind=connection)
+                added.append(index.name)
+    return added
+
+
+def seed_low_stock_queue():
+    # The stock monitor only drains the queue, so products that were low before it existed would never be restocked
+    batch_size = app.config['LOW_STOCK_QUEUE_BATCH_SIZE']
+    last_id = 0
+    while True:
+        product_ids = db.session.execute(
+            select(Catalog.product_id).where(Catalog.product_id > last_id).order_by(Catalog.product_id).limit(batch_size)
+        ).scalars().all()
+        if not product_ids:
+            break
+        queue_low_stock(product_ids)
+        db.session.commit()
+        last_id = product_ids[-1]
+    return db.session.execute(select(func.count()).select_from(LowStockQueue)).scalar()
+
+
+def main():
+    with app.app_context():
+        with db.engine.begin() as connection:
+            inspector = inspect(connection)
+            columns = add_missing_columns(connection, inspector)
+            indexes = add_missing_indexes(connection, inspector)
+        queued = seed_low_stock_queue()
+    print(f"columns added: {', '.join(columns) or 'none'}")
+    print(f"indexes added: {', '.join(indexes) or 'none'}")
+    print(f"products in the low-stock queue: {queued}")
+
+
+if __name__ == '__main__':
+    main()
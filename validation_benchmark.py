@@ -0,0 +1,95 @@
+# Check the compiled loaders against marshmallow and time both on order-sized payloads.
+# tests/test_schema_compiler.py runs the same parity corpus. Importing the app creates its tables, so point
+# DATABASE_URL at a scratch database first: python validation_benchmark.py [order_lines] [repeats]
+from marshmallow import ValidationError
+from app import account_schema, customer_schema, order_schema, product_schema
+from app import load_account, load_customer, load_order, load_product
+import random
+import sys
+import timeit
+
+ODD_VALUES = [None, True, False, 0, -1, 7, 2.5, 1e400, float("nan"), 10 ** 400, "", "12", "2.5", "abc", "x" * 20, [], [1], {}, {"a": 1}]
+
+VALID_PAYLOADS = {
+    "customer": {"name": "Jane Doe", "email": "jane@example.com", "phone": "555-0100"},
+    "account": {"customer_id": 1, "username": "janedoe01", "password": "correct-horse-battery"},
+    "product": {"name": "Widget", "price": 2.5},
+    "order": {"customer_id": 1, "order_details": [{"product_id": 1, "quantity": 2}, {"product_name": "Widget", "quantity": 1}]},
+}
+
+LOADERS = {
+    "customer": (customer_schema, load_customer),
+    "account": (account_schema, load_account),
+    "product": (product_schema, load_product),
+    "order": (order_schema, load_order),
+}
+
+
+def variants(payload):
+    # The valid payload, every field missing or replaced by an odd value, and unknown keys
+    yield payload
+    for key in payload:
+        yield {name: value for name, value in payload.items() if name != key}
+        for odd in ODD_VALUES:
+            yield {**payload, key: odd}
+    yield {**payload, "unexpected": 1}
+    yield {**payload, "id": 5}
+    yield {**payload, "order_date_time": "2024-01-01T00:00:00"}
+
+
+def order_variants():
+    base = VALID_PAYLOADS["order"]
+    line = base["order_details"][0]
+    for bad_line in variants(line):
+        yield {**base, "order_details": [line, bad_line, line]}
+    for odd in ODD_VALUES:
+        yield {**base, "order_details": [odd, line]}
+
+
+def outcome(load, payload):
+    try:
+        return "ok", load(payload)
+    except ValidationError as error:
+        return "error", error.messages
+
+
+def check_parity():
+    checked = 0
+    mismatches = []
+    for name, (schema, compiled) in LOADERS.items():
+        payloads = list(variants(VALID_PAYLOADS[name])) + ODD_VALUES
+        if name == "order":
+            payloads += list(order_variants())
+        for payload in payloads:
+            checked += 1
+            expected, actual = outcome(schema.load, payload), outcome(compiled, payload)
+            if expected != actual:
+                mismatches.append((name, payload, expected, actual))
+    return checked, mismatches
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    checked, mismatches = check_parity()
+    for name, payload, expected, actual in mismatches:
+        print(f"MISMATCH {name}: {payload!r}\n  marshmallow: {expected!r}\n  compiled:    {actual!r}")
+    print(f"parity: {checked - len(mismatches)}/{checked} payloads identical")
+
+    random.seed(42)
+    order = {"customer_id": 1, "order_details": [
+        {"product_id": random.randint(1, 5000), "quantity": random.randint(1, 20)} for _ in range(line_count)
+    ]}
+    print(f"{'schema':<10}{'marshmallow ms':>16}{'compiled ms':>14}{'speedup':>10}")
+    for name, payload in [*VALID_PAYLOADS.items(), (f"order x{line_count}", order)]:
+        schema, compiled = LOADERS[name.split()[0]]
+        number = 1 if name.startswith("order x") else 1000
+        slow = min(timeit.repeat(lambda: schema.load(payload), number=number, repeat=repeats)) / number
+        fast = min(timeit.repeat(lambda: compiled(payload), number=number, repeat=repeats)) / number
+        print(f"{name:<10}{slow * 1000:>16.3f}{fast * 1000:>14.3f}{slow / fast:>9.1f}x")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()